@@ -1,12 +1,11 @@
 import os.path
+from importlib.metadata import version
 from logging import DEBUG, WARN, Formatter, StreamHandler, getLogger, handlers
 
 import appdirs
 
 # versioning information
-from pkg_resources import get_distribution
-
-__version__ = get_distribution(__name__).version
+__version__ = version(__name__)
 
 #
 # Global constants
@@ -66,7 +65,8 @@ def setup_log_file_handler(log_dir=LOG_DIR):
     """Create RotatingFileHandler for package logger, storing logs in
     'log_dir' (default: LOG_DIR). The directory is created if not existing.
     """
-    os.makedirs(log_dir, exist_ok=True)
+    if not os.path.isdir(log_dir):
+        os.makedirs(log_dir, exist_ok=True)
     file_handler = handlers.RotatingFileHandler(
         os.path.join(log_dir, "log"), maxBytes=5e6, backupCount=5
     )
@@ -1,15 +1,15 @@
 """Command line interface of financeager application."""
 # PYTHON_ARGCOMPLETE_OK
+# Modules that are only required when actually running a command (not when
+# e.g. displaying help) are imported within the functions to speed up startup.
 import argparse
+import copy
+import functools
 import os
 import sys
-import time
 from datetime import datetime
 
 import argcomplete
-import pkg_resources
-from dateutil import parser as du_parser
-from rich.console import Console
 
 import financeager
 
@@ -18,12 +18,8 @@ from . import (
     RECURRENT_TABLE,
     UNSET_INDICATOR,
     __version__,
-    clients,
-    config,
-    entries,
     exceptions,
     init_logger,
-    listing,
     make_log_stream_handler_verbose,
     setup_log_file_handler,
 )
@@ -34,6 +30,39 @@ logger = init_logger(__name__)
 SUCCESS = 0
 FAILURE = 1
 
+# Verbs to report the successful modification of an element by the given command
+_VERB_BY_COMMAND = {
+    "add": "Added",
+    "update": "Updated",
+    "remove": "Removed",
+    "copy": "Copied",
+}
+
+# Built-in commands whose parameters don't require preprocessing. Parameters of
+# commands provided by plugins are always preprocessed
+_UNPROCESSED_COMMANDS = frozenset(["get", "remove", "copy", "pockets"])
+
+# Commands that accept the --pocket option, resp. the --recurrent option
+_POCKET_COMMANDS = frozenset(["add", "get", "remove", "update", "list"])
+_RECURRENT_ALIAS_COMMANDS = frozenset(["add", "get", "remove", "update", "copy"])
+
+# Options of the list command that are only relevant for formatting the response
+_LIST_FORMATTING_OPTIONS = (
+    "stacked_layout",
+    "entry_sort",
+    "category_sort",
+    "category_percentage",
+    "json",
+)
+
+# Fields only present for recurrent entries
+_RECURRENT_FIELDS = ("frequency", "start", "end")
+
+# Formats to parse the 'month' option with: month name (abbreviated or full),
+# month number (zero-padded or not; -m / #m for non-zero-padded numbers on
+# UNIX / Windows)
+_MONTH_FORMATS = ("%b", "%B", "%m", "%-m", "%#m")
+
 
 def main():
     """Main command line entry point of the application.
@@ -44,19 +73,25 @@ def main():
     Relevant command line arguments and options are parsed and passed to
     'run()'.
     """
-    os.makedirs(financeager.DATA_DIR, exist_ok=True)
+    from . import config
+
+    if not os.path.isdir(financeager.DATA_DIR):
+        os.makedirs(financeager.DATA_DIR, exist_ok=True)
 
     # Adding the FileHandler here avoids cluttering the log during tests
     setup_log_file_handler()
 
-    plugins = [
-        ep.load()() for ep in pkg_resources.iter_entry_points("financeager.services")
-    ]
+    plugins = _load_plugins()
 
     args = _parse_command(plugins=plugins)
+
+    config_filepath, config_mtime = _resolve_config_filepath(
+        args.pop("config_filepath")
+    )
+
     try:
-        configuration = config.Configuration(
-            args.pop("config_filepath"), plugins=plugins
+        configuration = config.Configuration.load(
+            config_filepath, plugins=plugins, mtime=config_mtime
         )
         exit_code = run(configuration=configuration, plugins=plugins, **args)
 
@@ -67,6 +102,39 @@ def main():
     sys.exit(exit_code)
 
 
+def _resolve_config_filepath(filepath):
+    """Fall back to the default config file if no filepath is given and the
+    default file exists. Return the filepath together with the modification
+    time of the file (in nanoseconds) for caching the loaded configuration. The
+    modification time is None if the file does not exist.
+    """
+    if filepath is None:
+        try:
+            stat = os.stat(financeager.CONFIG_FILEPATH)
+        except OSError:
+            return None, None
+        return financeager.CONFIG_FILEPATH, stat.st_mtime_ns
+
+    try:
+        return filepath, os.stat(filepath).st_mtime_ns
+    except OSError:
+        # Loading the configuration reports the non-existing file
+        return filepath, None
+
+
+def _load_plugins():
+    """Load the plugins registered at the 'financeager.services' entry point."""
+    from importlib.metadata import entry_points
+
+    try:
+        eps = entry_points(group="financeager.services")
+    except TypeError:  # pragma: no cover
+        # Python < 3.10 only provides the dict interface
+        eps = entry_points().get("financeager.services", [])
+
+    return [ep.load()() for ep in eps]
+
+
 def run(command, configuration, plugins=None, verbose=False, sinks=None, **params):
     """Run 'command' request using additional 'params'.
 
@@ -85,43 +153,42 @@ def run(command, configuration, plugins=None, verbose=False, sinks=None, **param
 
     :return: UNIX return code (zero for success, non-zero otherwise)
     """
+    from . import clients
+
     if verbose:
         make_log_stream_handler_verbose()
 
     formatting_options = {}
 
-    def _info(message):
-        """Wrapper to format message and propagate it to stdout. The original
-        message is logged at INFO-level.
-        """
-        response = _format_response(message, command, **formatting_options)
-        logger.info(message)
+    if sinks is None:
 
-        if isinstance(response, str):
-            print(response)
-        else:  # pragma: no cover
-            Console().print(response)
+        def _info(message):
+            """Wrapper to format message and propagate it to stdout. The original
+            message is logged at INFO-level.
+            """
+            response = _format_response(message, command, **formatting_options)
+            logger.info(message)
 
-    sinks = sinks or clients.Client.Sinks(_info, logger.error)
+            if isinstance(response, str):
+                print(response)
+            else:  # pragma: no cover
+                _get_console().print(response)
 
-    try:
-        _preprocess(params)
-    except exceptions.PreprocessingError as e:
-        sinks.error(e)
-        return FAILURE
+        sinks = clients.Client.Sinks(_info, logger.error)
+
+    if command not in _UNPROCESSED_COMMANDS:
+        try:
+            _preprocess(params)
+        except exceptions.PreprocessingError as e:
+            sinks.error(e)
+            return FAILURE
 
     formatting_options["default_category"] = configuration.get_option(
         "FRONTEND", "default_category"
     )
     if command == "list":
         # Extract formatting options; irrelevant, even confusing for Server
-        for option in [
-            "stacked_layout",
-            "entry_sort",
-            "category_sort",
-            "category_percentage",
-            "json",
-        ]:
+        for option in _LIST_FORMATTING_OPTIONS:
             formatting_options[option] = params.pop(option)
         if params["recurrent_only"]:
             formatting_options["recurrent_only"] = True
@@ -136,51 +203,29 @@ def run(command, configuration, plugins=None, verbose=False, sinks=None, **param
     return exit_code
 
 
+@functools.lru_cache(maxsize=None)
+def _get_console():
+    """Create rich Console on first use, and reuse it afterwards."""
+    from rich.console import Console
+
+    return Console()
+
+
 def _preprocess(data):
     """Preprocess data to be passed to Client (e.g. convert date format, parse
     'filters' and 'month' options passed with list command).
 
     :raises: PreprocessError if preprocessing failed.
     """
-    for field in ["date", "start", "end"]:
-        date = data.get(field)
-        if field == "end" and date == UNSET_INDICATOR:
-            continue  # skip validation
-
-        if date is not None:
-            try:
-                date = time.strftime(
-                    POCKET_DATE_FORMAT,
-                    du_parser.parse(date, yearfirst=True).timetuple(),
-                )
-                data[field] = date
-            except ValueError:
-                raise exceptions.PreprocessingError("Invalid date format.")
-
-    filter_items = data.get("filters")
-    parsed_items = {}
-    if filter_items is not None:
-        # convert list of "key=value" strings into dictionary
-        try:
-            for item in filter_items:
-                key, value = item.split("=")
-                parsed_items[key] = value.lower()
-
-            for field, indicator in zip(
-                ["category", "end"], [entries.CategoryEntry.DEFAULT_NAME, ""]
-            ):
-                # Substitute category default name, or empty string for end
-                try:
-                    if parsed_items[field] == indicator:
-                        parsed_items[field] = None
-                except KeyError:
-                    # No field present
-                    pass
+    for field, preprocess in _PREPROCESSORS:
+        value = data.get(field)
+        if value is not None:
+            data[field] = preprocess(value)
 
-            data["filters"] = parsed_items
-        except ValueError:
-            # splitting returned less than two parts due to missing separator
-            raise exceptions.PreprocessingError(f"Invalid filter format: {item}")
+    filters = data.get("filters")
+    if filters and any(n in filters for n in _RECURRENT_FIELDS):
+        # Assume that only recurrent table shall be displayed
+        data["recurrent_only"] = True
 
     month = data.pop("month", None)
     if month is not None:
@@ -194,10 +239,9 @@ def _preprocess(data):
             # This is subject to the machine's locale setting
             date = None
 
-            # -m / #m for parsing non-zero-padded numbers on UNIX / Windows
-            for fmt in ["b", "B", "m", "-m", "#m"]:
+            for fmt in _MONTH_FORMATS:
                 try:
-                    date = datetime.strptime(month, f"%{fmt}").replace(year=today.year)
+                    date = datetime.strptime(month, fmt).replace(year=today.year)
                     break
                 except ValueError:
                     continue
@@ -205,20 +249,17 @@ def _preprocess(data):
             if date is None:
                 raise exceptions.PreprocessingError(f"Invalid month: {month}")
 
-        if filter_items is None:
+        if not filters:
             data["filters"] = {}
 
         # Overwrite 'filters' setting. Filter for entries of current year
         data["filters"]["date"] = f"{date.strftime('%Y-%m')}-"
 
-    if any([data.get(f) for f in ["frequency", "start", "end"]]):
+    if any(data.get(f) for f in _RECURRENT_FIELDS):
         # Assume that entry should be added to recurrent table
         data["table_name"] = RECURRENT_TABLE
-    if any(n in parsed_items for n in ["start", "end", "frequency"]):
-        # Assume that only recurrent table shall be displayed
-        data["recurrent_only"] = True
 
-    for field_name in ["category", "name"]:
+    for field_name in ("category", "name"):
         field = data.get(field_name)
         if field is not None:
             field = field.strip()
@@ -228,11 +269,95 @@ def _preprocess(data):
             data[field_name] = field
 
 
+def _preprocess_date(date):
+    """Convert the given date into POCKET_DATE_FORMAT.
+
+    :raises: PreprocessingError if the date can't be parsed
+    """
+    try:
+        return _convert_date(date)
+    except ValueError:
+        raise exceptions.PreprocessingError("Invalid date format.")
+
+
+def _preprocess_end_date(date):
+    """Like _preprocess_date() but skip conversion of the unset indicator."""
+    if date == UNSET_INDICATOR:
+        return date
+    return _preprocess_date(date)
+
+
+def _preprocess_filters(filter_items):
+    """Convert list of "key=value" strings into dictionary. Filters for the
+    default category or for an empty end are converted to None.
+
+    :raises: PreprocessingError if an item lacks the separator
+    """
+    if not filter_items:
+        return filter_items
+
+    from .entries import CategoryEntry
+
+    parsed_items = {}
+    for item in filter_items:
+        key, separator, value = item.partition("=")
+        if not separator:
+            raise exceptions.PreprocessingError(f"Invalid filter format: {item}")
+        parsed_items[key] = value.lower()
+
+    default_name = CategoryEntry.DEFAULT_NAME
+    for field, indicator in (("category", default_name), ("end", "")):
+        # Substitute category default name, or empty string for end
+        if field in parsed_items and parsed_items[field] == indicator:
+            parsed_items[field] = None
+
+    return parsed_items
+
+
+# Functions to preprocess the corresponding parameters if present
+_PREPROCESSORS = (
+    ("date", _preprocess_date),
+    ("start", _preprocess_date),
+    ("end", _preprocess_end_date),
+    ("filters", _preprocess_filters),
+)
+
+
+def _convert_date(date):
+    """Convert the given date string into POCKET_DATE_FORMAT. The common formats
+    YYYY-MM-DD and MM-DD (current year) are parsed directly; any other format is
+    left to the more flexible yet much slower dateutil parser.
+
+    :raises: ValueError if the date can't be parsed
+    """
+    parsed_date = None
+    if date.replace("-", "").isdecimal():
+        try:
+            if len(date) == 10 and date[4] == date[7] == "-":
+                parsed_date = datetime(int(date[:4]), int(date[5:7]), int(date[8:]))
+            elif len(date) == 5 and date[2] == "-":
+                parsed_date = datetime(
+                    datetime.today().year, int(date[:2]), int(date[3:])
+                )
+        except ValueError:
+            # Possibly valid in a different interpretation, e.g. YY-MM
+            pass
+
+    if parsed_date is None:
+        from dateutil import parser as du_parser
+
+        parsed_date = du_parser.parse(date, yearfirst=True)
+
+    return parsed_date.strftime(POCKET_DATE_FORMAT)
+
+
 def _format_response(response, command, **listing_options):
     """Format the given response (dict or str) into human-readable text.
     If the response is a string, it is immediately returned.
-    If the response does not contain any of the fields 'id', 'elements',
-    'element', or 'pockets', an empty string is returned.
+    Responses to built-in commands are formatted by the dedicated function; an
+    empty string is returned if the response lacks the expected field.
+    Otherwise, if the response does not contain any of the fields 'id',
+    'elements', 'element', or 'pockets', an empty string is returned.
     The 'listing_options' are passed to listing.prettify().
 
     :return: str
@@ -240,52 +365,71 @@ def _format_response(response, command, **listing_options):
     if isinstance(response, str):
         return response
 
+    format_response = _FORMATTERS.get(command)
+    if format_response is not None:
+        return format_response(response, **listing_options)
+
+    # Response to a command provided by a plugin
+    if response.get("id") is not None:
+        return _format_id_response(response, command=command)
+
+    if response.get("elements") is not None:
+        return _format_elements_response(response, **listing_options)
+
+    if response.get("element") is not None:
+        return _format_element_response(response, **listing_options)
+
+    return _format_pockets_response(response)
+
+
+def _format_id_response(response, *, command, **_):
+    """Format the response holding the ID of the element affected by command."""
     eid = response.get("id")
-    if eid is not None:
-        verb = {
-            "add": "Added",
-            "update": "Updated",
-            "remove": "Removed",
-            "copy": "Copied",
-        }[command]
-        return f"{verb} element {eid}."
+    if eid is None:
+        return ""
+    return f"{_VERB_BY_COMMAND[command]} element {eid}."
 
+
+def _format_elements_response(response, **listing_options):
+    """Format the response holding the elements of a listing."""
     elements = response.get("elements")
-    if elements is not None:
-        return listing.prettify(elements, **listing_options)
+    if elements is None:
+        return ""
+
+    from . import listing
 
+    return listing.prettify(elements, **listing_options)
+
+
+def _format_element_response(response, *, default_category, **_):
+    """Format the response holding a single element."""
     element = response.get("element")
-    if element is not None:
-        return entries.prettify(
-            element, default_category=listing_options["default_category"]
-        )
+    if element is None:
+        return ""
 
-    pockets = response.get("pockets", [])
-    return "\n".join([p for p in pockets])
+    from . import entries
 
+    return entries.prettify(element, default_category=default_category)
 
-def _parse_command(args=None, plugins=None):
-    """Parse the given list of args and return the result as dict."""
 
-    parser = argparse.ArgumentParser(
-        description="An application "
-        "that helps you administering your daily expenses and earnings."
-    )
+def _format_pockets_response(response, **_):
+    """Format the response holding the pocket names, one per line."""
+    return "\n".join(response.get("pockets", []))
 
-    parser.add_argument(
-        "-V",
-        "--version",
-        action="version",
-        version=f"financeager version {__version__}",
-        help="display version info and exit",
-    )  # pragma: no cover
 
-    subparsers = parser.add_subparsers(
-        dest="command",
-        metavar="command",
-    )
-    subparsers.required = True
+# Functions to format the response to the corresponding built-in command
+_FORMATTERS = {
+    **{
+        command: functools.partial(_format_id_response, command=command)
+        for command in _VERB_BY_COMMAND
+    },
+    "list": _format_elements_response,
+    "get": _format_element_response,
+    "pockets": _format_pockets_response,
+}
+
 
+def _build_add_parser(subparsers):
     add_parser = subparsers.add_parser("add", help="add an entry to the database")
 
     add_parser.add_argument("name", help="entry name")
@@ -315,6 +459,8 @@ is assumed""",
         "-e", "--end", default=None, help="end date of recurrent entry"
     )
 
+
+def _build_get_parser(subparsers):
     get_parser = subparsers.add_parser(
         "get", help="show information about single entry"
     )
@@ -326,6 +472,8 @@ is assumed""",
         help="Table to get the entry from. Default: 'standard'.",
     )
 
+
+def _build_remove_parser(subparsers):
     remove_parser = subparsers.add_parser(
         "remove", help="remove an entry from the database"
     )
@@ -337,6 +485,8 @@ is assumed""",
         help="Table to remove the entry from. Default: 'standard'.",
     )
 
+
+def _build_update_parser(subparsers):
     update_parser = subparsers.add_parser(
         "update", help="update one or more fields of an entry"
     )
@@ -360,6 +510,8 @@ is assumed""",
         "-e", "--end", help="new end date (for recurrent entries only)"
     )
 
+
+def _build_copy_parser(subparsers):
     copy_parser = subparsers.add_parser(
         "copy", help="copy an entry from one pocket to another, or within one pocket"
     )
@@ -385,6 +537,8 @@ is assumed""",
         help="Table to copy the entry from/to. Default: 'standard'.",
     )
 
+
+def _build_list_parser(subparsers):
     list_parser = subparsers.add_parser(
         "list", help="list all entries in the pocket database"
     )
@@ -455,59 +609,126 @@ is assumed""",
         "Helpful for processing data with jq or similar tools.",
     )
 
+
+def _build_pockets_parser(subparsers):
     subparsers.add_parser("pockets", help="list all pocket databases")
 
+
+# Builders of the subparsers of all built-in commands, in the order of display
+_SUBPARSER_BUILDERS = {
+    "add": _build_add_parser,
+    "get": _build_get_parser,
+    "remove": _build_remove_parser,
+    "update": _build_update_parser,
+    "copy": _build_copy_parser,
+    "list": _build_list_parser,
+    "pockets": _build_pockets_parser,
+}
+
+
+def _parse_command(args=None, plugins=None):
+    """Parse the given list of args and return the result as dict."""
+    if args is None:
+        args = sys.argv[1:]
+    plugins = tuple(plugins or [])
+
+    if "_ARGCOMPLETE" in os.environ:
+        # On shell completion, a parser with all subparsers is built. The call
+        # exits the process
+        argcomplete.autocomplete(_build_parser(None, plugins))
+
+    # Callers might modify the result (incl. list values), hence return a copy
+    # of the cached dict
+    return copy.deepcopy(_parse_args(tuple(args), plugins))
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_args(args, plugins):
+    """Parse the given tuple of args, and cache the result for subsequent calls
+    with identical args within the same process.
+    """
+    # Build the parser for the requested command only. If the command can't be
+    # determined (e.g. when requesting help), a parser with all subparsers is
+    # built. So it is if plugins are given since they might extend any of the
+    # built-in subparsers
+    command = args[0] if args else None
+    if command not in _SUBPARSER_BUILDERS or plugins:
+        command = None
+    parser = _build_parser(command, plugins)
+
+    parsed_args = vars(parser.parse_args(args=args))
+
+    # Set table name if not specified
+    recurrent = parsed_args.pop("recurrent", None)
+    if recurrent and parsed_args["table_name"] is None:
+        parsed_args["table_name"] = RECURRENT_TABLE
+
+    return parsed_args
+
+
+# Bounded since each distinct tuple of plugins would keep a parser alive
+@functools.lru_cache(maxsize=16)
+def _build_parser(command, plugins):
+    """Build the command line parser, and cache it for subsequent parsing within
+    the same process.
+
+    :param command: name of built-in command to build the subparser for. If None,
+        the subparsers of all commands are built
+    :param plugins: tuple of plugins to extend the parser with
+    """
+    parser = argparse.ArgumentParser(
+        description="An application "
+        "that helps you administering your daily expenses and earnings."
+    )
+
+    parser.add_argument(
+        "-V",
+        "--version",
+        action="version",
+        version=f"financeager version {__version__}",
+        help="display version info and exit",
+    )  # pragma: no cover
+
+    subparsers = parser.add_subparsers(
+        dest="command",
+        metavar="command",
+    )
+    subparsers.required = True
+
+    if command is None:
+        builders = _SUBPARSER_BUILDERS.values()
+    else:
+        builders = [_SUBPARSER_BUILDERS[command]]
+    for build in builders:
+        build(subparsers)
+
     # Extend with plugin parsers
-    plugins = plugins or []
     for plugin in plugins:
         plugin.cli_options.extend(subparsers)
 
     # Add common options to subparsers
-    for subparser in subparsers.choices.values():
+    for name, subparser in subparsers.choices.items():
         subparser.add_argument(
             "-C",
             "--config-filepath",
-            default=financeager.CONFIG_FILEPATH
-            if os.path.exists(financeager.CONFIG_FILEPATH)
-            else None,
             help=f"path to config file. Default: {financeager.CONFIG_FILEPATH}",
         )
         subparser.add_argument(
             "--verbose", action="store_true", help="Be verbose about internal workings"
         )
 
-        if subparser in [
-            add_parser,
-            get_parser,
-            remove_parser,
-            update_parser,
-            list_parser,
-        ]:
+        if name in _POCKET_COMMANDS:
             subparser.add_argument(
                 "-p", "--pocket", help="name of pocket to modify or query"
             )
 
-    for subparser in [
-        add_parser,
-        get_parser,
-        remove_parser,
-        update_parser,
-        copy_parser,
-    ]:
-        subparser.add_argument(
-            "-r",
-            "--recurrent",
-            action="store_true",
-            help="""alias for '-t recurrent'. If the -t option is simultaneously
+        if name in _RECURRENT_ALIAS_COMMANDS:
+            subparser.add_argument(
+                "-r",
+                "--recurrent",
+                action="store_true",
+                help="""alias for '-t recurrent'. If the -t option is simultaneously
 specified, the -r option is ignored""",
-        )
-
-    argcomplete.autocomplete(parser)
-    parsed_args = vars(parser.parse_args(args=args))
-
-    # Set table name if not specified
-    recurrent = parsed_args.pop("recurrent", None)
-    if recurrent and parsed_args["table_name"] is None:
-        parsed_args["table_name"] = RECURRENT_TABLE
+            )
 
-    return parsed_args
+    return parser
@@ -14,18 +14,19 @@ def create(*, configuration, sinks, plugins):
     configuration.
     Clients of service plugins are taken into account if specified.
     The sinks are passed into the Client.
+
+    :raises: KeyError if no client is available for the configured service
     """
-    clients = {
-        "local": LocalServerClient,
-    }
+    service_name = configuration.get_option("SERVICE", "name")
+    client_class = _BUILTIN_CLIENTS.get(service_name)
 
     plugins = plugins or []
     for p in plugins:
-        if isinstance(p, plugin.ServicePlugin):
-            clients[p.name] = p.client
+        if isinstance(p, plugin.ServicePlugin) and p.name == service_name:
+            client_class = p.client
 
-    service_name = configuration.get_option("SERVICE", "name")
-    client_class = clients[service_name]
+    if client_class is None:
+        raise KeyError(service_name)
 
     return client_class(configuration=configuration, sinks=sinks)
 
@@ -90,3 +91,9 @@ class LocalServerClient(Client):
     def shutdown(self):
         """Instruct stopping of Server."""
         self.proxy.run("stop")
+
+
+# Clients of built-in services, by service name
+_BUILTIN_CLIENTS = {
+    "local": LocalServerClient,
+}
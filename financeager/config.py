@@ -1,5 +1,7 @@
 """Configuration of the financeager application."""
-from configparser import ConfigParser, NoOptionError, NoSectionError
+import os
+import sys
+from configparser import ConfigParser, InterpolationError
 
 from financeager import plugin
 
@@ -9,10 +11,19 @@ from .exceptions import InvalidConfigError
 
 logger = init_logger(__name__)
 
+# Sentinel for options not present in the resolved options
+_MISSING = object()
+
+# Configurations created by Configuration.load(), keyed by filepath. Values are
+# tuples of modification time of the file, plugin names, and the configuration
+_CONFIG_CACHE = {}
+
 
 class Configuration:
     """Wrapper around a ConfigParser object holding configuration. The default
     configuration can be customized by settings specified in a config file.
+    All options are read once during initialization; modifying the underlying
+    ConfigParser afterwards has no effect on the returned options.
     """
 
     def __init__(self, filepath=None, plugins=None):
@@ -28,15 +39,57 @@ class Configuration:
         self._filepath = filepath
 
         self._plugins = plugins or []
+        self._valid_services = frozenset(
+            ["local"]
+            + [p.name for p in self._plugins if isinstance(p, plugin.ServicePlugin)]
+        )
         self._parser = ConfigParser()
+        # Getters of the ConfigParser for typed options
+        self._getters = {
+            "int": self._parser.getint,
+            "float": self._parser.getfloat,
+            "boolean": self._parser.getboolean,
+        }
         self._option_types = {}
+        self._resolved = {}
 
         self._init_defaults()
         self._init_option_types()
 
         self._load_custom_config()
+        self._resolve_options()
         self._validate()
 
+    @classmethod
+    def load(cls, filepath=None, plugins=None, mtime=None):
+        """Return a Configuration for the given filepath and plugins. Within one
+        process, repeated calls return the same instance as long as the config
+        file has not been modified and plugins of the same names are given. Only
+        the most recently loaded configuration per filepath is kept.
+        The returned instance is shared and must not be modified.
+        If the modification time of the file (in nanoseconds) is already known,
+        pass it as 'mtime' to avoid another stat call.
+
+        :raises: InvalidConfigError if validation fails
+        """
+        if filepath is None:
+            mtime = None
+        elif mtime is None:
+            try:
+                mtime = os.stat(filepath).st_mtime_ns
+            except OSError:
+                # Let the constructor raise an appropriate error
+                return cls(filepath, plugins=plugins)
+
+        plugin_names = tuple(p.name for p in plugins or [])
+        cached = _CONFIG_CACHE.get(filepath)
+        if cached is not None and cached[:2] == (mtime, plugin_names):
+            return cached[2]
+
+        configuration = cls(filepath, plugins=plugins)
+        _CONFIG_CACHE[filepath] = (mtime, plugin_names, configuration)
+        return configuration
+
     def _init_defaults(self):
         self._parser["SERVICE"] = {
             "name": "local",
@@ -49,8 +102,16 @@ class Configuration:
             p.config.init_defaults(self._parser)
 
     def _init_option_types(self):
+        # Plugins specify option types per section; store them flat with the
+        # (section, option) tuple as key
+        option_types = {}
         for p in self._plugins:
-            p.config.init_option_types(self._option_types)
+            p.config.init_option_types(option_types)
+
+        for section, section_option_types in option_types.items():
+            for option, option_type in section_option_types.items():
+                key = (sys.intern(section), sys.intern(option))
+                self._option_types[key] = option_type
 
     def _load_custom_config(self):
         """Update config values according to customization in config file."""
@@ -66,66 +127,80 @@ class Configuration:
         if len(used_filepaths) < 1 or used_filepaths[0] != self._filepath:
             raise InvalidConfigError("Config filepath does not exist!")
 
-        for section in self._parser.sections():
-            for item in self._parser.options(section):
-                try:
+        # Only take sections and options into account that are known from the
+        # defaults
+        for section in custom_config.sections():
+            if not self._parser.has_section(section):
+                continue
+
+            default_section = self._parser[section]
+            for item in custom_config.options(section):
+                if item in default_section:
                     # read raw value to avoid issues when reading date format
                     # containing percent-characters
-                    custom_value = custom_config.get(section, item, raw=True)
-                except (NoSectionError, NoOptionError):
-                    # section or option not specified by user
+                    default_section[item] = custom_config.get(section, item, raw=True)
+
+    def _resolve_options(self):
+        """Read all options of the configuration once and store them for fast
+        lookup. Typed options are converted, and thus validated for possible
+        conversion. Options that fail interpolation are not stored; the error
+        is raised when they are requested.
+
+        :raises: InvalidConfigError if conversion fails
+        """
+        for section in self._parser.sections():
+            for option in self._parser.options(section):
+                key = (sys.intern(section), sys.intern(option))
+                try:
+                    self._resolved[key] = self._get(section, option)
+                except ValueError:
+                    raise InvalidConfigError(
+                        f"Wrong type for option {option} in section {section}."
+                    )
+                except InterpolationError:
                     continue
-                self._parser[section][item] = custom_value
+
+    def _get(self, section, option):
+        """Read the requested option from the underlying ConfigParser."""
+        # If the option type is not specified, str is assumed
+        get = self._getters.get(
+            self._option_types.get((section, option)), self._parser.get
+        )
+        return get(section, option)
 
     def get_section(self, section):
         """Return a dictionary of options of the requested section.
         If an option is typed, a converted value is returned.
+
+        :raises: configparser.NoSectionError if the section does not exist
         """
         return {o: self.get_option(section, o) for o in self._parser.options(section)}
 
     def get_option(self, section, option):
         """Return the requested option of the configuration.
         If an option is typed, a converted value is returned.
-        """
-        try:
-            option_type = self._option_types[section][option]
-        except KeyError:
-            # Option type not specified, assuming str
-            option_type = None
-
-        if option_type in ("int", "float", "boolean"):
-            get = getattr(self._parser, f"get{option_type}")
-        else:
-            get = self._parser.get
 
-        return get(section, option)
+        :raises: configparser.NoSectionError or NoOptionError if the option
+            does not exist, configparser.InterpolationError if interpolating
+            the option value fails
+        """
+        value = self._resolved.get((section, option), _MISSING)
+        if value is _MISSING:
+            # Let the ConfigParser raise the appropriate error
+            return self._get(section, option)
+        return value
 
     def _validate(self):
-        """Validate certain options of the configuration. Typed options are
-        validated for possible conversion.
+        """Validate certain options of the configuration.
 
         :raises: InvalidConfigError
         """
-        valid_services = ["local"]
-        for p in self._plugins:
-            if isinstance(p, plugin.ServicePlugin):
-                valid_services.append(p.name)
-
         service_name = self.get_option("SERVICE", "name")
-        if service_name not in valid_services:
+        if service_name not in self._valid_services:
             raise InvalidConfigError(f"Unknown service name: {service_name}")
 
         if len(self.get_option("FRONTEND", "default_category")) < 1:
             raise InvalidConfigError("Default category name too short!")
 
-        for section in self._option_types:
-            for option in self._option_types[section]:
-                try:
-                    self.get_option(section, option)
-                except ValueError:
-                    raise InvalidConfigError(
-                        f"Wrong type for option {option} in section {section}."
-                    )
-
         for p in self._plugins:
             p.config.validate(self)
@@ -28,12 +28,23 @@ class BaseEntry(Entry):
 
     def __init__(self, name, value, date, eid=0):
         """:type eid: int or string, will be converted to int
-        :type date: str of valid format
+        :type date: str of POCKET_DATE_FORMAT
+
+        :raises: ValueError if date does not match POCKET_DATE_FORMAT
         """
         super().__init__(name, value)
-        self.date = time.strftime(
-            self.DATE_FORMAT, time.strptime(date, POCKET_DATE_FORMAT)
-        )
+        if (
+            self.DATE_FORMAT == "%y-%m-%d"
+            and len(date) == 10
+            and date[4] == date[7] == "-"
+        ):
+            # Convert from POCKET_DATE_FORMAT by dropping the century digits
+            # which is much faster than a strptime/strftime round trip
+            self.date = date[2:]
+        else:
+            self.date = time.strftime(
+                self.DATE_FORMAT, time.strptime(date, POCKET_DATE_FORMAT)
+            )
         self.eid = int(eid)
 
 
@@ -15,6 +15,11 @@ class Listing:
         self.name = name or "Listing"
         self.categories = categories or []
 
+        # Index of CategoryEntries by name for fast lookup
+        self._categories_by_name = {}
+        for category_entry in self.categories:
+            self._categories_by_name.setdefault(category_entry.name, category_entry)
+
     @classmethod
     def from_elements(cls, elements, default_category=None, name=None):
         """Create listing from list of element dictionaries"""
@@ -35,7 +40,8 @@ class Listing:
         :raises: TypeError if neither CategoryEntry nor BaseEntry given
         """
         if isinstance(entry, CategoryEntry):
-            if entry.name not in self.category_entry_names:
+            if entry.name not in self._categories_by_name:
+                self._categories_by_name[entry.name] = entry
                 self.categories.append(entry)
         elif isinstance(entry, BaseEntry):
             category_entry = self._get_category_entry(category_name)
@@ -70,14 +76,13 @@ class Listing:
         """
         category_name = category_name.lower()
 
-        for category_entry in self.categories:
-            if category_entry.name == category_name:
-                return category_entry
-        else:
+        category_entry = self._categories_by_name.get(category_name)
+        if category_entry is None:
             # Nothing found in existing categories
             category_entry = CategoryEntry(name=category_name)
             self.add_entry(category_entry)
-            return category_entry
+
+        return category_entry
 
     def total_value(self):
         """Return total value of the listing."""
@@ -111,36 +116,34 @@ def prettify(
 
 
 def _derive_listings(elements, *, default_category):
-    earnings = []
-    expenses = []
-
-    def _sort(eid, element):
-        # Copying avoids modifying the original element. Flattening is in order
-        # to distinguish recurrent entries (they have the same element ID which
-        # thus can't be used as dict key)
-        flat_element = element.copy()
-        flat_element["eid"] = eid
-        if flat_element["value"] > 0:
-            earnings.append(flat_element)
-        else:
-            expenses.append(flat_element)
+    """Sort elements by value into earnings and expenses listings, within a
+    single pass over all elements.
+
+    :return: list of two Listings, or None if there are no elements
+    """
+    listing_earnings = Listing(name="Earnings")
+    listing_expenses = Listing(name="Expenses")
+
+    def _add(eid, element):
+        # The element ID is passed on to distinguish recurrent entries (they
+        # share the ID of their generating element)
+        value = element["value"]
+        listing = listing_earnings if value > 0 else listing_expenses
+        listing.add_entry(
+            BaseEntry(name=element["name"], value=value, date=element["date"], eid=eid),
+            category_name=element.get("category") or default_category,
+        )
 
     # process standard elements
     for eid, element in elements[DEFAULT_TABLE].items():
-        _sort(eid, element)
+        _add(eid, element)
 
     # process recurrent elements, i.e. for each eid iterate list
     for eid, recurrent_elements in elements[RECURRENT_TABLE].items():
         for element in recurrent_elements:
-            _sort(eid, element)
+            _add(eid, element)
 
-    if not earnings and not expenses:
+    if not listing_earnings.categories and not listing_expenses.categories:
         return
 
-    listing_earnings = Listing.from_elements(
-        earnings, default_category=default_category, name="Earnings"
-    )
-    listing_expenses = Listing.from_elements(
-        expenses, default_category=default_category, name="Expenses"
-    )
     return [listing_earnings, listing_expenses]
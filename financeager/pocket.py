@@ -255,11 +255,11 @@ class TinyDbPocket(Pocket):
             old_category = old_entry["category"]
 
             # update category cache if one of name or category was changed
-            if fields.get("name") is not None or fields.get("category") is not None:
+            name = fields.get("name")
+            category = fields.get("category")
+            if name is not None or category is not None:
                 self._category_cache[old_name][old_category] -= 1
-                self._category_cache[fields.get("name") or old_name][
-                    fields.get("category") or old_category
-                ] += 1
+                self._category_cache[name or old_name][category or old_category] += 1
 
     def add_entry(self, table_name=None, **kwargs):
         """
@@ -1,6 +1,8 @@
+import os
 import shlex
 import tempfile
 import unittest
+import zlib
 from collections import defaultdict
 from datetime import datetime as dt
 from json import loads as jloads
@@ -8,6 +10,7 @@ from unittest import mock
 
 from rich.table import Table as RichTable
 
+import financeager
 from financeager import (
     DEFAULT_TABLE,
     RECURRENT_TABLE,
@@ -19,24 +22,33 @@ from financeager import (
     setup_log_file_handler,
 )
 
-TEST_CONFIG_FILEPATH = "/tmp/financeager-test-config"
+from .test_config import TestPluginConfiguration, create_configuration
+
 TEST_DATA_DIR = tempfile.mkdtemp(prefix="financeager-")
 setup_log_file_handler(TEST_DATA_DIR)
 
 
 class CliTestCase(unittest.TestCase):
+    # Data directory of the local server; in-memory storage if None
+    DATA_DIR = None
+
     @classmethod
     def setUpClass(cls):
         # Create test config file for client
-        with open(TEST_CONFIG_FILEPATH, "w") as file:
+        fd, cls.config_filepath = tempfile.mkstemp(prefix="financeager-config-")
+        cls.addClassCleanup(os.remove, cls.config_filepath)
+        with os.fdopen(fd, "w") as file:
             file.write(cls.CONFIG_FILE_CONTENT)
 
-        cls.pocket = 1900
-
     def setUp(self):
         # Separate test runs by running individual test methods using distinct
-        # pockets
-        self.__class__.pocket += 1
+        # pockets. Deriving the pocket from the test ID makes it independent of
+        # the order of execution
+        self.pocket = zlib.crc32(self.id().encode())
+
+        # Point the local server to the data directory of the test case
+        self.addCleanup(setattr, financeager, "DATA_DIR", financeager.DATA_DIR)
+        financeager.DATA_DIR = self.DATA_DIR
 
         # Mocks to record output of cli.run() call
         self.info = mock.MagicMock()
@@ -51,7 +63,8 @@ class CliTestCase(unittest.TestCase):
         'command_line' is a string of the form that financeager is called from
         the command line with. 'format_args' are optional objects that are
         formatted into the command line string. Must be passed as tuple if more
-        than one.
+        than one. Alternatively, 'command_line' is a list of already split
+        arguments (then 'format_args' are ignored).
 
         If information about an added/update/removed/copied element was to be
         logged, the corresponding ID is matched from the log call arguments to
@@ -61,16 +74,19 @@ class CliTestCase(unittest.TestCase):
         self.info.reset_mock()
         self.error.reset_mock()
 
-        if not isinstance(format_args, tuple):
-            format_args = (format_args,)
-        args = shlex.split(command_line.format(*format_args))
+        if isinstance(command_line, str):
+            if not isinstance(format_args, tuple):
+                format_args = (format_args,)
+            args = shlex.split(command_line.format(*format_args))
+        else:
+            args = list(command_line)
         command = args[0]
 
         # Exclude option from subcommand parsers that would be confused
         if command not in ["copy", "pockets"]:
             args.extend(["--pocket", str(self.pocket)])
 
-        args.extend(["--config-filepath", TEST_CONFIG_FILEPATH])
+        args.extend(["--config-filepath", self.config_filepath])
 
         sinks = clients.Client.Sinks(self.info, self.error)
 
@@ -118,8 +134,8 @@ class CliTestCase(unittest.TestCase):
         return response
 
 
-@mock.patch("financeager.DATA_DIR", None)
 class CliLocalServerNoneConfigTestCase(CliTestCase):
+    DATA_DIR = None
     CONFIG_FILE_CONTENT = ""  # service 'local' is the default anyway
 
     @mock.patch("tinydb.storages.MemoryStorage.write")
@@ -134,7 +150,7 @@ class CliLocalServerNoneConfigTestCase(CliTestCase):
     @mock.patch("financeager.cli.logger.info")
     def test_pockets(self, mocked_info, mocked_print):
         cli.run(
-            "pockets", configuration=config.Configuration(filepath=TEST_CONFIG_FILEPATH)
+            "pockets", configuration=config.Configuration(filepath=self.config_filepath)
         )
 
         mocked_info.assert_called_once_with({"pockets": []})
@@ -146,7 +162,7 @@ class CliLocalServerNoneConfigTestCase(CliTestCase):
         # Cover the behavior of cli._format_response() given a str
         mocked_run.return_value = "response"
         cli.run(
-            "pockets", configuration=config.Configuration(filepath=TEST_CONFIG_FILEPATH)
+            "pockets", configuration=config.Configuration(filepath=self.config_filepath)
         )
 
         self.assertListEqual(
@@ -155,8 +171,8 @@ class CliLocalServerNoneConfigTestCase(CliTestCase):
         mocked_print.assert_called_once_with("response")
 
 
-@mock.patch("financeager.DATA_DIR", TEST_DATA_DIR)
 class CliLocalServerTestCase(CliTestCase):
+    DATA_DIR = TEST_DATA_DIR
     CONFIG_FILE_CONTENT = """\
 [SERVICE]
 name = local
@@ -169,26 +185,26 @@ default_category = no-category"""
         self.assertEqual(entry_id, 1)
 
         # Verify that customized default category is used
-        response = self.cli_run("get {}", format_args=entry_id)
+        response = self.cli_run(["get", str(entry_id)])
         self.assertIn("no-category", response.lower())
 
     def test_add_entry_with_date(self):
         entry_id = self.cli_run("add something -1 -d 20-03-04 -c ' very good '")
         self.assertEqual(entry_id, 1)
 
-        response = self.cli_run("get {}", format_args=entry_id)
+        response = self.cli_run(["get", str(entry_id)])
         self.assertIn("Date    : 2020-03-04", response)
         self.assertIn("Category: Very Good", response)
 
         self.cli_run("update {} -c -", format_args=entry_id)
-        response = self.cli_run("get {}", format_args=entry_id)
+        response = self.cli_run(["get", str(entry_id)])
         self.assertNotIn("Very Good", response)
         self.assertNotIn("Category: -", response)
 
     def test_add_entry_with_tablename_and_recurrent(self):
         entry_id = self.cli_run("add stuff 1 -t standard -r")
         self.assertEqual(entry_id, 1)
-        response = self.cli_run("get {}", format_args=entry_id)
+        response = self.cli_run(["get", str(entry_id)])
         self.assertIn("stuff", response.lower())
 
     def test_add_recurrent_entry_without_tablename(self):
@@ -224,7 +240,7 @@ default_category = no-category"""
 
     def test_verbose(self):
         entry_id = self.cli_run("add stuff 100 --verbose")
-        response = self.cli_run("get {}", format_args=entry_id)
+        response = self.cli_run(["get", str(entry_id)])
         self.assertIn("stuff", response.lower())
 
     def test_list_month(self):
@@ -428,6 +444,25 @@ class PreprocessTestCase(unittest.TestCase):
         cli._preprocess(data)
         self.assertDictEqual(data, {"date": f"{dt.today().year}-02-28"})
 
+    def test_date_iso(self):
+        data = {"date": "2020-02-29", "start": "2021-12-01", "end": "2022-01-31"}
+        cli._preprocess(data)
+        self.assertDictEqual(
+            data,
+            {
+                "date": "2020-02-29",
+                "start": "2021-12-01",
+                "end": "2022-01-31",
+                "table_name": RECURRENT_TABLE,
+            },
+        )
+
+    def test_date_other_format(self):
+        for date in ("2020/03/04", "20-03-04", "Mar 4 2020"):
+            data = {"date": date}
+            cli._preprocess(data)
+            self.assertDictEqual(data, {"date": "2020-03-04"})
+
     def test_date_format_error(self):
         data = {"date": "01_01"}
         self.assertRaises(
@@ -450,6 +485,11 @@ class PreprocessTestCase(unittest.TestCase):
         data = {"filters": ["value-123"]}
         self.assertRaises(exceptions.PreprocessingError, cli._preprocess, data)
 
+    def test_filter_value_with_separator(self):
+        data = {"filters": ["name=a=b"]}
+        cli._preprocess(data)
+        self.assertEqual(data["filters"], {"name": "a=b"})
+
     def test_default_category_filter(self):
         data = {"filters": ["category=unspecified"]}
         cli._preprocess(data)
@@ -460,6 +500,15 @@ class PreprocessTestCase(unittest.TestCase):
         cli._preprocess(data)
         self.assertEqual(data["filters"], {"date": f"{dt.today().year}-01-"})
 
+        data = {"month": "Jan", "filters": []}
+        cli._preprocess(data)
+        self.assertEqual(data["filters"], {"date": f"{dt.today().year}-01-"})
+
+    def test_no_filters(self):
+        data = {"filters": None}
+        cli._preprocess(data)
+        self.assertEqual(data, {"filters": None})
+
     def test_recurrent_only_fields_filter(self):
         filters = {
             "frequency": "year",
@@ -495,6 +544,34 @@ class FormatResponseTestCase(unittest.TestCase):
     def test_copy(self):
         self.assertEqual("Copied element 1.", cli._format_response({"id": 1}, "copy"))
 
+    def test_missing_field(self):
+        for command in ("add", "update", "remove", "copy", "list", "get", "pockets"):
+            with self.subTest(command=command):
+                self.assertEqual(
+                    cli._format_response({}, command, default_category=None), ""
+                )
+
+    def test_plugin_command(self):
+        self.assertEqual("", cli._format_response({}, "bird"))
+        self.assertEqual(
+            "foo\nbar", cli._format_response({"pockets": ["foo", "bar"]}, "bird")
+        )
+        self.assertIn(
+            "Name    : Foo",
+            cli._format_response(
+                {
+                    "element": {
+                        "name": "foo",
+                        "value": 1,
+                        "date": "2020-01-01",
+                        "category": None,
+                    }
+                },
+                "bird",
+                default_category="misc",
+            ),
+        )
+
     def test_list(self):
         self.assertEqual(
             "No entries found.",
@@ -552,12 +629,66 @@ class FormatResponseTestCase(unittest.TestCase):
         )
 
 
+class ParseCommandTestCase(unittest.TestCase):
+    def test_command(self):
+        args = cli._parse_command(["get", "1", "-r"])
+        self.assertEqual(args["command"], "get")
+        self.assertEqual(args["table_name"], RECURRENT_TABLE)
+
+    def test_default_config_filepath(self):
+        # The default config file is only taken into account by main()
+        self.assertIsNone(cli._parse_command(["list"])["config_filepath"])
+
+    def test_resolve_config_filepath(self):
+        with tempfile.NamedTemporaryFile() as file:
+            mtime = os.stat(file.name).st_mtime_ns
+
+            with mock.patch("financeager.CONFIG_FILEPATH", file.name):
+                self.assertEqual(cli._resolve_config_filepath(None), (file.name, mtime))
+
+            # An explicitly given filepath takes precedence
+            with mock.patch("financeager.CONFIG_FILEPATH", "/nonexisting/config"):
+                self.assertEqual(
+                    cli._resolve_config_filepath(file.name), (file.name, mtime)
+                )
+
+    @mock.patch("financeager.CONFIG_FILEPATH", "/nonexisting/config")
+    def test_resolve_nonexisting_config_filepath(self):
+        self.assertEqual(cli._resolve_config_filepath(None), (None, None))
+        self.assertEqual(
+            cli._resolve_config_filepath("/nonexisting/config"),
+            ("/nonexisting/config", None),
+        )
+
+    def test_cached_result(self):
+        args = cli._parse_command(["remove", "1"])
+        args.pop("eid")
+
+        # Modifying a returned result does not affect subsequent calls
+        self.assertEqual(cli._parse_command(["remove", "1"])["eid"], "1")
+
+        args = cli._parse_command(["list", "-f", "name=a"])
+        args["filters"].append("name=b")
+        self.assertEqual(
+            cli._parse_command(["list", "-f", "name=a"])["filters"], ["name=a"]
+        )
+
+    @mock.patch("sys.stderr")
+    def test_invalid_command(self, _):
+        self.assertRaises(SystemExit, cli._parse_command, ["bogus"])
+
+
 class TestPluginCliOptions(plugin.PluginCliOptions):
     def extend(self, command_parser):
         bird_parser = command_parser.add_parser("bird")
         bird_parser.add_argument("--sound")
 
 
+class ExtendingPluginCliOptions(plugin.PluginCliOptions):
+    def extend(self, command_parser):
+        command_parser.choices["list"].add_argument("--foo")
+
+
 class TestClient(clients.Client):
     def safely_run(self, command, **params):
         if command != "bird":
@@ -573,7 +704,7 @@ class PluginCliOptionsTestCase(unittest.TestCase):
     def test_cli_options(self):
         test_plugin = plugin.ServicePlugin(
             name="test-plugin",
-            config=None,
+            config=TestPluginConfiguration(),
             cli_options=TestPluginCliOptions(),
             client=TestClient,
         )
@@ -582,11 +713,33 @@ class PluginCliOptionsTestCase(unittest.TestCase):
         self.assertEqual(args["command"], "bird")
         self.assertEqual(args["sound"], "tweet")
 
-        configuration = config.Configuration()
-        configuration._parser["SERVICE"] = {"name": "test-plugin"}
+        configuration = create_configuration(
+            "[SERVICE]\nname = test-plugin\n", plugins=[test_plugin]
+        )
         exit_code = cli.run(**args, configuration=configuration, plugins=[test_plugin])
         self.assertEqual(exit_code, cli.SUCCESS)
 
+    @mock.patch("importlib.metadata.entry_points")
+    def test_load_plugins(self, mocked_entry_points):
+        entry_point = mock.MagicMock()
+        mocked_entry_points.return_value = [entry_point]
+
+        plugins = cli._load_plugins()
+        mocked_entry_points.assert_called_once_with(group="financeager.services")
+        self.assertEqual(plugins, [entry_point.load.return_value.return_value])
+
+    def test_extend_builtin_command(self):
+        test_plugin = plugin.PluginBase(
+            name="test-plugin", config=None, cli_options=ExtendingPluginCliOptions()
+        )
+
+        args = cli._parse_command("list --foo bar".split(), plugins=[test_plugin])
+        self.assertEqual(args["foo"], "bar")
+
+        # Parsing other commands is not affected
+        args = cli._parse_command("add x 1".split(), plugins=[test_plugin])
+        self.assertEqual(args["command"], "add")
+
 
 if __name__ == "__main__":
     unittest.main()
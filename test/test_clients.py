@@ -1,6 +1,7 @@
 import unittest
+from unittest import mock
 
-from financeager import cli, clients, config, plugin
+from financeager import cli, clients, plugin
 
 from . import test_config
 
@@ -12,16 +13,17 @@ class TestClient(clients.Client):
 class CreateClientsTestCase(unittest.TestCase):
     def test_create(self):
         # Given the app configuration specifies to use the 'test' service
-        app_config = config.Configuration()
-        app_config._parser["SERVICE"]["name"] = "test"
-
-        # When the create-factory is invoked
         plugin_config = test_config.TestPluginConfiguration()
         service_plugin = plugin.ServicePlugin(
             config=plugin_config,
             name="test",
             client=TestClient,
         )
+        app_config = test_config.create_configuration(
+            "[SERVICE]\nname = test\n", plugins=[service_plugin]
+        )
+
+        # When the create-factory is invoked
         some_plugin = plugin.PluginBase(name="some-plugin", config=plugin_config)
         client = clients.create(
             configuration=app_config,
@@ -38,6 +40,15 @@ class CreateClientsTestCase(unittest.TestCase):
             cli._parse_command(["list"], plugins=[some_plugin])["command"], "list"
         )
 
+    def test_create_unknown_service(self):
+        # Configuration validation would reject the unknown service
+        app_config = mock.Mock()
+        app_config.get_option.return_value = "unknown"
+
+        with self.assertRaises(KeyError) as cm:
+            clients.create(configuration=app_config, sinks=None, plugins=None)
+        self.assertEqual(cm.exception.args[0], "unknown")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,36 +1,93 @@
+import os
 import tempfile
-import time
 import unittest
+from configparser import InterpolationMissingOptionError, NoOptionError, NoSectionError
 
 from financeager import plugin
-from financeager.config import Configuration, InvalidConfigError
+from financeager.config import _CONFIG_CACHE, Configuration, InvalidConfigError
+
+
+def create_configuration(content, plugins=None):
+    """Create a Configuration from a temporary config file with given content."""
+    with tempfile.NamedTemporaryFile("w", delete=False) as file:
+        file.write(content)
+    try:
+        return Configuration(filepath=file.name, plugins=plugins)
+    finally:
+        os.remove(file.name)
 
 
 class ConfigTestCase(unittest.TestCase):
     def test_sections(self):
-        config = Configuration()
+        config = Configuration.load()
         self.assertSetEqual(set(config._parser.sections()), {"SERVICE", "FRONTEND"})
 
     def test_get_option(self):
-        config = Configuration()
+        config = Configuration.load()
         self.assertEqual(config.get_option("SERVICE", "name"), "local")
         self.assertDictEqual(config.get_section("SERVICE"), {"name": "local"})
 
+    def test_nonexisting_option(self):
+        config = Configuration.load()
+        self.assertRaises(NoSectionError, config.get_option, "FOO", "name")
+        self.assertRaises(NoOptionError, config.get_option, "SERVICE", "foo")
+        self.assertRaises(NoSectionError, config.get_section, "FOO")
+
     def test_invalid_config(self):
-        filepath = f"/tmp/{int(time.time())}"
+        with tempfile.NamedTemporaryFile(delete=False) as file:
+            filepath = file.name
+        self.addCleanup(os.remove, filepath)
 
         for content in (
             "[SERVICE]\nname = sillyservice\n",
             "[FRONTEND]\ndefault_category = ",
         ):
-            with open(filepath, "w") as file:
-                file.write(content)
-            self.assertRaises(InvalidConfigError, Configuration, filepath=filepath)
+            with self.subTest(content=content):
+                with open(filepath, "w") as file:
+                    file.write(content)
+                self.assertRaises(InvalidConfigError, Configuration, filepath=filepath)
+
+    def test_load(self):
+        self.assertIs(Configuration.load(), Configuration.load())
+
+        with tempfile.NamedTemporaryFile("w", delete=False) as file:
+            file.write("[FRONTEND]\ndefault_category = misc\n")
+        filepath = file.name
+        self.addCleanup(os.remove, filepath)
+
+        config = Configuration.load(filepath)
+        self.assertIs(config, Configuration.load(filepath))
+        self.assertEqual(config.get_option("FRONTEND", "default_category"), "misc")
+
+        # Plugins are identified by name
+        pl = plugin.PluginBase(name="test-plugin", config=TestPluginConfiguration())
+        plugin_config = Configuration.load(filepath, plugins=[pl])
+        self.assertIsNot(config, plugin_config)
+        same_pl = plugin.PluginBase(
+            name="test-plugin", config=TestPluginConfiguration()
+        )
+        self.assertIs(plugin_config, Configuration.load(filepath, plugins=[same_pl]))
+
+        # Modifying the file invalidates the cached configuration
+        with open(filepath, "w") as file:
+            file.write("[FRONTEND]\ndefault_category = other\n")
+        stat = os.stat(filepath)
+        os.utime(filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        config = Configuration.load(filepath)
+        self.assertEqual(config.get_option("FRONTEND", "default_category"), "other")
+
+        # Passing the modification time explicitly gives the same cache entry
+        mtime = os.stat(filepath).st_mtime_ns
+        self.assertIs(config, Configuration.load(filepath, mtime=mtime))
+
+        # Only the most recently loaded configuration of a file is kept
+        self.assertIs(_CONFIG_CACHE[filepath][2], config)
 
     def test_nonexisting_config_filepath(self):
-        filepath = f"/tmp/{time.time()}"
-        with self.assertRaises(InvalidConfigError) as cm:
-            Configuration(filepath=filepath)
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, "config")
+            with self.assertRaises(InvalidConfigError) as cm:
+                Configuration(filepath=filepath)
         self.assertTrue(
             cm.exception.args[0].endswith("Config filepath does not exist!")
         )
@@ -48,6 +105,11 @@ class TestPluginConfiguration(plugin.PluginConfiguration):
         }
 
 
+class InterpolatingPluginConfiguration(plugin.PluginConfiguration):
+    def init_defaults(self, config_parser):
+        config_parser["TESTSECTION"] = {"path": "%(missing)s/data"}
+
+
 class PluginConfigTestCase(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -55,8 +117,16 @@ class PluginConfigTestCase(unittest.TestCase):
             name="test-plugin", config=TestPluginConfiguration()
         )
 
+    def setUp(self):
+        # Config file shared by the tests of this class
+        with tempfile.NamedTemporaryFile(delete=False) as file:
+            self.filepath = file.name
+
+    def tearDown(self):
+        os.unlink(self.filepath)
+
     def test_init_defaults(self):
-        config = Configuration(plugins=[self.plugin])
+        config = Configuration.load(plugins=[self.plugin])
 
         # Since creating the Configuration instance did not fail, validation was
         # successful
@@ -69,32 +139,51 @@ class PluginConfigTestCase(unittest.TestCase):
             {"test": 42, "flag": False, "number": 1.0},
         )
 
+    def test_interpolation_error_on_access(self):
+        pl = plugin.PluginBase(
+            name="test-plugin", config=InterpolatingPluginConfiguration()
+        )
+        # Unused options with invalid interpolation don't fail the configuration
+        config = Configuration(plugins=[pl])
+        self.assertRaises(
+            InterpolationMissingOptionError, config.get_option, "TESTSECTION", "path"
+        )
+
     def test_load_custom_test_section(self):
-        filepath = tempfile.mkstemp()[1]
-        with open(filepath, "w") as file:
+        with open(self.filepath, "w") as file:
             file.write("[TESTSECTION]\ntest = 84\n")
 
-        config = Configuration(filepath=filepath, plugins=[self.plugin])
+        config = Configuration(filepath=self.filepath, plugins=[self.plugin])
         self.assertEqual(config.get_option("TESTSECTION", "test"), 84)
 
+    def test_ignore_unknown_custom_options(self):
+        with open(self.filepath, "w") as file:
+            file.write("[TESTSECTION]\nfoo = bar\n[OTHERSECTION]\ntest = 0\n")
+
+        config = Configuration(filepath=self.filepath, plugins=[self.plugin])
+        self.assertEqual(config.get_option("TESTSECTION", "test"), 42)
+        self.assertNotIn("foo", config.get_section("TESTSECTION"))
+        self.assertNotIn("OTHERSECTION", config._parser.sections())
+
     def test_validate(self):
-        filepath = tempfile.mkstemp()[1]
-        with open(filepath, "w") as file:
+        with open(self.filepath, "w") as file:
             file.write("[TESTSECTION]\ntest = no-int\n")
 
         self.assertRaises(
-            InvalidConfigError, Configuration, filepath=filepath, plugins=[self.plugin]
+            InvalidConfigError,
+            Configuration,
+            filepath=self.filepath,
+            plugins=[self.plugin],
         )
 
     def test_load_service_plugin_config(self):
         pl = plugin.ServicePlugin(
             name="test-plugin", config=TestPluginConfiguration(), client=None
         )
-        filepath = tempfile.mkstemp()[1]
-        with open(filepath, "w") as file:
+        with open(self.filepath, "w") as file:
             file.write(f"[SERVICE]\nname = {pl.name}\n")
 
-        config = Configuration(filepath=filepath, plugins=[pl])
+        config = Configuration(filepath=self.filepath, plugins=[pl])
         self.assertEqual(config.get_option("SERVICE", "name"), pl.name)
 
 
@@ -25,6 +25,11 @@ class BaseEntryTestCase(unittest.TestCase):
         )
         self.assertEqual(entry.date, "00-02-29")
 
+    def test_invalid_date(self):
+        for date in ("10.08.2000", "2000-08"):
+            with self.subTest(date=date):
+                self.assertRaises(ValueError, BaseEntry, "name", 1, date)
+
 
 class NegativeBaseEntryTestCase(unittest.TestCase):
     @classmethod
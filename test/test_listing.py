@@ -29,6 +29,16 @@ class AddCategoryEntryTwiceTestCase(unittest.TestCase):
         self.assertEqual(1, len(list(self.listing.category_entry_names)))
 
 
+class ListingWithCategoriesTestCase(unittest.TestCase):
+    def test_add_entry_to_given_category(self):
+        category_entry = CategoryEntry(name="rent")
+        listing = Listing(categories=[category_entry])
+        listing.add_entry(BaseEntry("flat", -500, "2000-01-01"), "Rent")
+
+        self.assertEqual(len(listing.categories), 1)
+        self.assertEqual(category_entry.value, 500)
+
+
 class AddBaseEntryTestCase(unittest.TestCase):
     def setUp(self):
         self.listing = Listing()
@@ -143,6 +153,10 @@ class PrettifyListingsTestCase(unittest.TestCase):
         for category in listing_expenses.categories:
             self.assertEqual(len(category.entries), 1)
 
+        # The original elements are not modified
+        self.assertEqual(expense["category"], "groceries")
+        self.assertNotIn("eid", earning)
+
 
 if __name__ == "__main__":
     unittest.main()
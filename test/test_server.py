@@ -1,6 +1,7 @@
-import os.path
+import os
 import tempfile
 import unittest
+from types import MappingProxyType
 
 from financeager import (
     DEFAULT_POCKET_NAME,
@@ -12,6 +13,12 @@ from financeager import (
 )
 
 
+def setUpModule():
+    # Initialize TinyDB and the pocket machinery once, so that the first test
+    # does not bear the one-time cost
+    server.Server().run("add", name="warm-up", value=0)
+
+
 class AddEntryToServerTestCase(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -20,23 +27,26 @@ class AddEntryToServerTestCase(unittest.TestCase):
             "add", name="Hiking boots", value=-111.11, category="outdoors", pocket="0"
         )
 
-    def test_pocket_name(self):
-        self.assertEqual("0", self.server._pockets["0"].name)
+    def test_server_state(self):
+        with self.subTest("pocket name"):
+            self.assertEqual("0", self.server._pockets["0"].name)
 
-    def test_pockets(self):
-        response = self.server.run("pockets")
-        self.assertListEqual(response["pockets"], ["0"])
+        with self.subTest("pockets"):
+            response = self.server.run("pockets")
+            self.assertListEqual(response["pockets"], ["0"])
 
-    def test_unknown_command(self):
-        response = self.server.run("peace")
-        self.assertIn("peace", response["error"])
+        with self.subTest("unknown command"):
+            response = self.server.run("peace")
+            self.assertIn("peace", response["error"])
 
 
 class RecurrentEntryServerTestCase(unittest.TestCase):
-    def setUp(self):
-        self.server = server.Server()
-        self.pocket = "2000"
-        self.entry_id = self.server.run(
+    @classmethod
+    def setUpClass(cls):
+        # The tests don't modify the source pocket, hence it is shared
+        cls.server = server.Server()
+        cls.pocket = "2000"
+        cls.entry_id = cls.server.run(
             "add",
             name="rent",
             value=-1000,
@@ -44,7 +54,7 @@ class RecurrentEntryServerTestCase(unittest.TestCase):
             frequency="monthly",
             start="2000-01-02",
             end="2000-07-01",
-            pocket=self.pocket,
+            pocket=cls.pocket,
         )["id"]
 
     def test_recurrent_entries(self):
@@ -66,22 +76,32 @@ class RecurrentEntryServerTestCase(unittest.TestCase):
         # copied and added as first element, hence ID 1
         self.assertEqual(copied_entry_id, 1)
 
-        source_entry = self.server.run(
-            "get", pocket=self.pocket, table_name=RECURRENT_TABLE, eid=self.entry_id
-        )["element"]
-        destination_entry = self.server.run(
-            "get",
-            table_name=RECURRENT_TABLE,
-            pocket=destination_pocket,
-            eid=copied_entry_id,
-        )["element"]
+        source_entry = self.server._pockets[self.pocket].get_entry(
+            eid=self.entry_id, table_name=RECURRENT_TABLE
+        )
+        destination_entry = self.server._pockets[destination_pocket].get_entry(
+            eid=copied_entry_id, table_name=RECURRENT_TABLE
+        )
         self.assertDictEqual(source_entry, destination_entry)
 
 
 class FindEntryServerTestCase(unittest.TestCase):
+    # Read-only filters shared by the tests
+    DEFAULT_CATEGORY_FILTERS = MappingProxyType(
+        {"category": entries.CategoryEntry.DEFAULT_NAME}
+    )
+    HIKING_BOOTS_FILTERS = MappingProxyType(
+        {"name": "Hiking boots", "category": entries.CategoryEntry.DEFAULT_NAME}
+    )
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = server.Server()
+        cls.pocket = "0"
+
     def setUp(self):
-        self.server = server.Server()
-        self.pocket = "0"
+        # Reset the server state from previous tests
+        self.server._pockets.clear()
         self.entry_id = self.server.run(
             "add", name="Hiking boots", value=-111.11, pocket=self.pocket
         )["id"]
@@ -110,9 +130,8 @@ class FindEntryServerTestCase(unittest.TestCase):
         self.assertEqual(str(error), "Invalid input data:\nvalue: Not a valid number.")
 
     def test_query_and_reset_response(self):
-        category = entries.CategoryEntry.DEFAULT_NAME
         response = self.server.run(
-            "list", pocket=self.pocket, filters={"category": category}
+            "list", pocket=self.pocket, filters=self.DEFAULT_CATEGORY_FILTERS
         )
         self.assertGreater(len(response), 0)
         self.assertIsInstance(response, dict)
@@ -129,12 +148,7 @@ class FindEntryServerTestCase(unittest.TestCase):
         self.assertEqual(response["id"], self.entry_id)
 
         response = self.server.run(
-            "list",
-            pocket=self.pocket,
-            filters={
-                "name": "Hiking boots",
-                "category": entries.CategoryEntry.DEFAULT_NAME,
-            },
+            "list", pocket=self.pocket, filters=self.HIKING_BOOTS_FILTERS
         )
         self.assertDictEqual(response["elements"][DEFAULT_TABLE], {})
         self.assertDictEqual(response["elements"][RECURRENT_TABLE], {})
@@ -161,12 +175,10 @@ class FindEntryServerTestCase(unittest.TestCase):
         # copied and added as first element, hence ID 1
         self.assertEqual(copied_entry_id, 1)
 
-        source_entry = self.server.run("get", pocket=self.pocket, eid=self.entry_id)[
-            "element"
-        ]
-        destination_entry = self.server.run(
-            "get", pocket=destination_pocket, eid=copied_entry_id
-        )["element"]
+        source_entry = self.server._pockets[self.pocket].get_entry(eid=self.entry_id)
+        destination_entry = self.server._pockets[destination_pocket].get_entry(
+            eid=copied_entry_id
+        )
         self.assertDictEqual(source_entry, destination_entry)
 
     def test_unsuccessful_copy(self):
@@ -180,8 +192,16 @@ class FindEntryServerTestCase(unittest.TestCase):
 
 
 class JsonPocketsServerTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp_dir.cleanup()
+
     def test_pockets(self):
-        tmp_dir = tempfile.mkdtemp()
+        tmp_dir = self.tmp_dir.name
         self.server = server.Server(data_dir=tmp_dir)
 
         self.assertDictEqual(self.server.run("pockets"), {"pockets": []})
@@ -189,7 +209,8 @@ class JsonPocketsServerTestCase(unittest.TestCase):
         # Create dummy JSON files
         pockets = ["1000", "1500"]
         for p in pockets:
-            open(os.path.join(tmp_dir, f"{p}.json"), "w").close()
+            fd = os.open(os.path.join(tmp_dir, f"{p}.json"), os.O_CREAT | os.O_WRONLY)
+            os.close(fd)
 
         self.assertDictEqual(self.server.run("pockets"), {"pockets": pockets})
 